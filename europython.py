@@ -5,9 +5,12 @@ import re
 import datetime
 import functools
 import time
-from typing import *
+from typing import Iterable
 from pathlib import Path
 from dataclasses import dataclass
+
+# Set before mido so libportmidi is found on the first try.
+os.environ["DYLD_FALLBACK_LIBRARY_PATH"] = "/opt/homebrew/lib/"
 import mido
 
 
@@ -24,16 +27,12 @@ print(
             "re",
             "sys",
             "time",
-            "typing.*",
             "portmidi",
         )
     )
 )
 
-os.environ["DYLD_FALLBACK_LIBRARY_PATH"] = "/opt/homebrew/lib/"
-
 import threading
-import queue
 from collections import deque
 
 import traceback
@@ -53,6 +52,9 @@ def gather_exceptions(args):
 
 
 def show_exceptions():
+    if not thread_exceptions:  # runs before every prompt, usually nothing to do
+        return
+
     with excepthook_lock:
         if thread_exceptions:
             reader = _get_reader()
@@ -68,11 +70,52 @@ from _pyrepl.simple_interact import _get_reader
 
 _get_reader().console.pre_input_hook = show_exceptions
 threading.excepthook = gather_exceptions
+# Hand the GIL over more often (default: 5ms) so the clock isn't starved
+# by busy sequencers.
+sys.setswitchinterval(0.0005)
+
+
+def prioritize_current_thread() -> None:
+    """Best effort: ask the OS to schedule the calling thread ahead of others."""
+    if sys.platform == "darwin":
+        import ctypes
+
+        QOS_CLASS_USER_INTERACTIVE = 0x21
+        try:
+            libc = ctypes.CDLL(None)
+            libc.pthread_set_qos_class_self_np(QOS_CLASS_USER_INTERACTIVE, 0)
+        except (OSError, AttributeError):
+            pass
+    elif hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(20))
+        except OSError:
+            pass  # needs CAP_SYS_NICE or an rtprio limit
 
 
 LAUNCHPAD_PORT = "Launchpad Pro Standalone Port"
+LAUNCHPAD_HEADER = b"\x00\x20\x29\x02\x10\x0A"  # SysEx: set LEDs (Launchpad Pro)
 CLOCK_PORT = "IAC aiotone"
 
+# 0-indexed 8x8 grid coord <-> Launchpad NOTE_ON note number (0xFF: not a pad)
+INDEX_TO_PAD = bytes(10 * y + x + 11 for y in range(8) for x in range(8))
+PAD_TO_INDEX = bytes(
+    INDEX_TO_PAD.index(note) if note in INDEX_TO_PAD else 0xFF for note in range(128)
+)
+
+# Board.coords starts out as this: a complete SysEx message with the header,
+# then (LED, color) pairs for the 8x8 grid and the side LED.
+_coords = bytearray(b"\xF0" + LAUNCHPAD_HEADER + (b"\x00" * 130) + b"\xF7")
+_coords[7 : 7 + 128 : 2] = INDEX_TO_PAD
+_coords[7 + 128] = 0x63  # side LED
+COORDS_TEMPLATE = bytes(_coords)
+del _coords
+
+BOARD_REFRESH_INTERVAL = 0.01  # seconds
+WHEEL_SIZE = 384  # pulses, 4 bars at 24 PPQN
+EMPTY_WHEEL = (0,) * WHEEL_SIZE
+MIDI_OUT_QUEUE_SIZE = 256  # messages; the oldest get dropped while a port stalls
+
 
 SysEx = functools.partial(mido.Message, "sysex")
 NoteOn = functools.partial(mido.Message, "note_on")
@@ -80,31 +123,136 @@ NoteOff = functools.partial(mido.Message, "note_off")
 CC = functools.partial(mido.Message, "control_change")
 
 portmidi = mido.Backend("mido.backends.portmidi", load=True)
+port_names_lock = threading.Lock()
+port_names: dict[str, tuple[float, list[str]]] = {}
+
+
+def cached_port_names(kind: str, ttl: float = 1.0) -> list[str]:
+    """Returns input or output port names, enumerating at most every `ttl` s.
+
+    `kind` is "input" or "output". Threads waiting for their ports share one
+    enumeration instead of each re-scanning (and possibly re-initializing)
+    PortMidi on their own.
+    """
+    with port_names_lock:
+        now = time.monotonic()
+        checked, names = port_names.get(kind, (float("-inf"), []))
+        if now - checked >= ttl:
+            if kind == "input":
+                names = portmidi.get_input_names()
+            else:
+                names = portmidi.get_output_names()
+            port_names[kind] = (now, names)
+        return names
+
+
+def send_sysex(output, sysex: bytes) -> None:
+    """Writes a complete SysEx message (F0 ... F7) to a portmidi output port.
+
+    Unlike `output.send()`, this doesn't build, copy, and re-encode
+    a mido.Message for every call.
+    """
+    pm = portmidi.module.pm
+    with output._lock:
+        portmidi.module._check_error(pm.lib.Pm_WriteSysEx(output._stream, 0, sysex))
 
 
 class MIDIOut(threading.Thread):
     def __init__(self, port: str) -> None:
         super().__init__(name=f"MIDI Out [{port}]", daemon=True)
-        self.queue: queue.Queue[mido.Message] = queue.Queue()
+        self.queue: deque[mido.Message] = deque()
+        self.note_offs: deque[mido.Message] = deque()  # dropped from queue, go first
+        self.note_off_keys: set[int] = set()  # (ch << 8 | note) in note_offs
+        self.order_lock = threading.Lock()  # queue head <-> note_offs, see trim()
+        self.trimming = False  # set by trim() before it touches the queue head
+        self.popping = False  # set by run() around a lock-free popleft()
+        self.pending = threading.Event()
         self.connected = False
         self.port = port
         self.start()
 
     def send(self, message: mido.Message) -> None:
-        self.queue.put(message, block=False)
+        self.queue.append(message)
+        if len(self.queue) > MIDI_OUT_QUEUE_SIZE:
+            self.trim()
+        # Event.set() takes a lock; skip it while the consumer is already
+        # signalled. It clears the flag before draining, so this can't lose
+        # a message.
+        if not self.pending.is_set():
+            self.pending.set()
+
+    def send_many(self, messages: Iterable[mido.Message]) -> None:
+        self.queue.extend(messages)
+        if len(self.queue) > MIDI_OUT_QUEUE_SIZE:
+            self.trim()
+        if not self.pending.is_set():
+            self.pending.set()
+
+    def trim(self) -> None:
+        """Drops the oldest messages past MIDI_OUT_QUEUE_SIZE, except note-offs.
+
+        Those are older than anything left in the queue, so sending them first
+        keeps the order. Notes don't hang because of a stalled port.
+        A note_on with velocity 0 counts as a note-off, same as in `Board.run()`.
+
+        Only one note-off per channel and note is kept: every message between
+        two of them was dropped too, so the second one is redundant. That caps
+        `note_offs` at 16 * 128 messages.
+
+        `trimming` and `popping` are a handshake with `run()`: whichever side
+        sets its flag second sees the other's, so `run()` never takes a newer
+        message off the queue while an older note-off moves to `note_offs`.
+        """
+        with self.order_lock:
+            self.trimming = True
+            while self.popping:
+                time.sleep(0)
+            while len(self.queue) > MIDI_OUT_QUEUE_SIZE:
+                message = self.queue.popleft()
+                if message.type == "note_off" or (
+                    message.type == "note_on" and message.velocity == 0
+                ):
+                    key = message.channel << 8 | message.note
+                    if key not in self.note_off_keys:
+                        self.note_off_keys.add(key)
+                        self.note_offs.append(message)
+            self.trimming = False
 
     def run(self):
-        while self.port not in portmidi.get_output_names():
+        while self.port not in cached_port_names("output"):
             time.sleep(1)
         output = portmidi.open_output(self.port)
         self.connected = True
 
         while True:
-            message = self.queue.get()
-            try:
-                output.send(message)
-            except ValueError as ve:
-                print(self.name, ve)
+            self.pending.wait()
+            self.pending.clear()
+            while True:
+                self.popping = True
+                if self.trimming or self.note_offs:
+                    self.popping = False
+                    with self.order_lock:
+                        if self.note_offs:
+                            message = self.note_offs.popleft()
+                            self.note_off_keys.discard(
+                                message.channel << 8 | message.note
+                            )
+                        elif self.queue:
+                            message = self.queue.popleft()
+                        else:
+                            break
+                else:
+                    # No trim in flight and no note-offs waiting: skip the lock.
+                    try:
+                        message = self.queue.popleft()
+                    except IndexError:
+                        break
+                    finally:
+                        self.popping = False
+                try:
+                    output.send(message)
+                except ValueError as ve:
+                    print(self.name, ve)
 
 
 class Stopped(Exception):
@@ -116,93 +264,153 @@ class Board(threading.Thread):
         super().__init__(name="Board", daemon=True)
 
         self.connected = False
-        self.coords = bytearray(b"\x00\x20\x29\x02\x10\x0A" + (b"\x00" * 130))
-        for pad_index in range(64):
-            pad_coord = self.index_to_pad(pad_index)
-            self.coords[6 + 2 * pad_index] = pad_coord
-        self.coords[6 + 128] = 0x63  # side LED
+        self.coords = bytearray(COORDS_TEMPLATE)
+        self.dirty = True  # coords changed since the last update()
+        self.sent: bytes | None = None  # coords as of the last update()
+        self.update_lock = threading.Lock()  # update() runs on Clock and Board Refresh
+        self.self_update = threading.Event()  # set while no clock drives updates
+        self.one_led = bytearray(b"\xF0" + LAUNCHPAD_HEADER + b"\x00\x00\xF7")
         self.reset()
 
-        while LAUNCHPAD_PORT not in portmidi.get_output_names():
+        while LAUNCHPAD_PORT not in cached_port_names("output"):
             time.sleep(1)
         self.output = portmidi.open_output(LAUNCHPAD_PORT)
         # not connected yet, wait for input in run()
 
     def run(self):
-        while LAUNCHPAD_PORT not in portmidi.get_input_names():
+        prioritize_current_thread()
+        while LAUNCHPAD_PORT not in cached_port_names("input"):
             time.sleep(1)
 
-        counter = -1
         input = portmidi.open_input(LAUNCHPAD_PORT)
         self.connected = True
-        while True:
-            counter = (counter + 1) % 100
-            if not counter:
-                self.maybe_update()
-
-            message = input.poll()
-            if not message:
-                time.sleep(0.0001)
-                continue
+        threading.Thread(target=self.refresh, name="Board Refresh", daemon=True).start()
+        for message in input:
             if message.type == "note_off":
                 message.type = "note_on"
                 message.velocity = 0
 
             if message.type == "note_on":
-                index = self.pad_to_index(message.note) + 1
+                index = PAD_TO_INDEX[message.note] + 1
+                if index > 64:
+                    continue  # not a grid pad
                 if message.velocity:
-                    self.pad(index, 0x03)
+                    self.pad(index, 0x03, flush=True)
                 else:
                     # FIXME: Board shouldn't know about "clock"
-                    self.pad(index, clock.flip(index))
+                    self.pad(index, clock.flip(index), flush=True)
+
+    def refresh(self):
+        """Keep the LEDs current while there's no clock driving updates."""
+        while True:
+            self.self_update.wait()
+            time.sleep(BOARD_REFRESH_INTERVAL)
+            self.maybe_update()
 
     def clock_update(self):
-        self.self_update = False
+        if self.self_update.is_set():  # skip the Event's lock on every tick
+            self.self_update.clear()
         self.update()
 
     def maybe_update(self):
-        if self.self_update:
+        if self.self_update.is_set():
             self.update()
 
     def update(self):
-        try:
-            self.output.send(SysEx(data=self.coords))
-        except ValueError as ve:
-            print(self.name, ve)
+        with self.update_lock:
+            if not self.dirty:
+                return
+
+            # Clear before reading coords so a concurrent pad() is never lost.
+            self.dirty = False
+            coords = bytes(self.coords)
+            sent = self.sent
+            if sent is None:
+                sysex = coords
+            else:
+                # Only (LED, color) pairs that changed, same "set LEDs" command.
+                sysex = bytearray(coords[:7])
+                for offset in range(8, 8 + 130, 2):
+                    if coords[offset] != sent[offset]:
+                        sysex += coords[offset - 1 : offset + 1]
+                if len(sysex) == 7:
+                    return
+                sysex.append(0xF7)
+                sysex = bytes(sysex)
+            try:
+                send_sysex(self.output, sysex)
+            except OSError as oe:
+                print(self.name, oe)
+                # Unknown what made it out, send everything next time.
+                self.sent = None
+                self.dirty = True
+            else:
+                self.sent = coords
 
     def reset(self):
-        self.self_update = True
-        self.coords[6 + 129] = 0x01  # side LED
-
-    def pad(self, number: int, color: int) -> None:
-        """`number` is 1-indexed. Color is Launchpad programmer's mode."""
-        self.coords[6 + 2 * (number - 1) + 1] = color
+        self.self_update.set()
+        self.coords[7 + 129] = 0x01  # side LED
+        self.dirty = True
+
+    def pad(self, number: int, color: int, *, flush: bool = False) -> None:
+        """`number` is 1-indexed. Color is Launchpad programmer's mode, 0..127.
+
+        With `flush`, the LED is sent right away instead of with the next
+        update. Only the Board thread may flush: it owns `one_led`.
+        """
+        if not 0 <= color <= 127:
+            raise ValueError(f"color must be in range 0..127, got {color!r}")
+        offset = 6 + 2 * number
+        if self.coords[offset] != color:
+            self.coords[offset] = color
+            self.dirty = True
+        if flush:
+            self.one_led[7] = self.coords[offset - 1]
+            self.one_led[8] = color
+            try:
+                send_sysex(self.output, bytes(self.one_led))
+            except OSError as oe:
+                print(self.name, oe)
+
+    def pad_many(self, numbers: Iterable[int], colors: Iterable[int]) -> None:
+        """Like `pad()` for many pads at once, `numbers` and `colors` paired up."""
+        coords = self.coords
+        for number, color in zip(numbers, colors):
+            if not 0 <= color <= 127:
+                raise ValueError(f"color must be in range 0..127, got {color!r}")
+            offset = 6 + 2 * number
+            if coords[offset] != color:
+                coords[offset] = color
+                self.dirty = True
 
     def index_to_pad(self, index: int) -> int:
         """Argument is 0-indexed 8x8 grid coord. Result is Launchpad NOTE_ON note number."""
-        x = index % 8
-        y = index // 8
-        return 10 * y + x + 11
+        return INDEX_TO_PAD[index]
 
     def pad_to_index(self, pad: int) -> int:
-        """Argument is Launchpad NOTE_ON note number. Result is 0-indexed 8x8 grid coord."""
-        x = (pad - 1) % 10
-        y = (pad - 1) // 10
-        return 8 * (y - 1) + x
+        """Argument is Launchpad NOTE_ON note number. Result is 0-indexed 8x8 grid coord.
+
+        Notes that aren't grid pads give 0xFF.
+        """
+        return PAD_TO_INDEX[pad]
 
 
 class Clock(threading.Thread):
     def __init__(self) -> None:
         super().__init__(name="Clock", daemon=True)
         self.connected = False
-        self.countdown_lock = threading.RLock()
-        self.countdowns: deque[set[int]] = deque()
-        self.bars: set[int] = set()
-        self.beats: set[int] = set()
+        self.countdown_lock = threading.Lock()
+        # one per sequencer index, all sharing `countdown_lock`
+        self.wakeups = [threading.Condition(self.countdown_lock) for _ in range(64)]
+        self.pulse = 0  # pulses since the clock was created, never reset
+        # bitmasks of sequencer indexes waiting for `pulse % WHEEL_SIZE`
+        self.wheel = [0] * WHEEL_SIZE
+        self.bars = 0  # bitmask of sequencer indexes waiting for the next bar
+        self.beats = 0  # bitmask of sequencer indexes waiting for the next beat
         self.board = Board()
         self.board.start()
-        self.sequencers: list[threading.Event | None] = [None] * 64
-        self.events = [threading.Event() for _ in range(64)]
+        self.registered = 0  # bitmask of sequencer indexes
+        self.woken = 0  # bitmask of sequencer indexes released from bar/beat waits
         self.reset()
         self.start()
 
@@ -214,18 +422,17 @@ class Clock(threading.Thread):
         self.board.reset()
         with self.countdown_lock:
             if full:
-                for ev in self.events:
-                    ev.set()
-                self.bars = set()
-            else:
-                for i, ev in enumerate(self.events):
-                    if i not in self.bars:
-                        ev.set()
-            self.beats = set()
-            self.countdowns = deque(set() for _ in range(384))
+                self.woken |= self.bars
+                self.bars = 0
+            self.woken |= self.beats
+            self.beats = 0
+            self.wheel[:] = EMPTY_WHEEL  # in place, no new list
+            for wakeup in self.wakeups:
+                wakeup.notify_all()
 
     def run(self):
-        while CLOCK_PORT not in portmidi.get_input_names():
+        prioritize_current_thread()
+        while CLOCK_PORT not in cached_port_names("input"):
             time.sleep(1)
         input = portmidi.open_input(CLOCK_PORT)
 
@@ -255,90 +462,106 @@ class Clock(threading.Thread):
             if self.position == 12:
                 self.board.pad(65, 0x36)
         with self.countdown_lock:
+            woken = self.woken
             if self.position == 0:
                 if self.beat == 0:
-                    for index in sorted(self.bars):
-                        ev = self.sequencers[index]
-                        if ev is not None:
-                            ev.set()
-                            self.bars.remove(index)
-                for index in sorted(self.beats):
-                    ev = self.sequencers[index]
-                    if ev is not None:
-                        ev.set()
-                        self.beats.remove(index)
-            current_set = self.countdowns.popleft()
-            for index in sorted(current_set):
-                ev = self.sequencers[index]
-                if ev is not None:
-                    ev.set()
-                else:
-                    self.countdowns[0].add(index)
-            self.countdowns.append(set())
+                    self.bars = self.wake(self.bars)
+                self.beats = self.wake(self.beats)
+            self.pulse += 1
+            slot = self.pulse % WHEEL_SIZE
+            due = self.wheel[slot] | (self.woken & ~woken)
+            if due:
+                self.wheel[slot] = 0
+                self.notify(due)
+
+    def notify(self, mask: int) -> None:
+        """Wakes sequencer indexes in `mask`. Call with `countdown_lock` held."""
+        while mask:
+            bit = mask & -mask
+            self.wakeups[bit.bit_length() - 1].notify_all()
+            mask ^= bit
+
+    def wake(self, mask: int) -> int:
+        """Wakes registered sequencers in `mask`. Returns the ones left waiting."""
+        self.woken |= mask & self.registered
+        return mask & ~self.registered
 
     def wait_for_beat(self, seq: int) -> None:
         index = seq - 1
-        ev = self.events[index]
         with self.countdown_lock:
-            self.beats.add(index)
-
-        self.wait_for(ev, index)
+            self.woken &= ~(1 << index)
+            self.beats |= 1 << index
+            self.wait_for(index)
 
     def wait_for_bar(self, seq: int) -> None:
         index = seq - 1
-        ev = self.events[index]
         with self.countdown_lock:
-            self.bars.add(index)
-
-        self.wait_for(ev, index)
+            self.woken &= ~(1 << index)
+            self.bars |= 1 << index
+            self.wait_for(index)
 
     def wait(self, seq: int, pulses: int) -> None:
         if pulses == 0:
             return
 
         index = seq - 1
-        ev = self.events[index]
         with self.countdown_lock:
-            self.countdowns[pulses - 1].add(index)
-
-        self.wait_for(ev, index)
-
-    def wait_for(self, ev: threading.Event, index: int) -> None:
-        ev.wait()
-        ev.clear()
+            target = self.pulse + pulses
+            while self.pulse < target:
+                # (re-)arm: waits longer than the wheel wake up early once per turn
+                self.wheel[target % WHEEL_SIZE] |= 1 << index
+                self.wakeups[index].wait()
+                if not self.running:
+                    raise Stopped("Clock stopped while waiting")
+                if not self.registered >> index & 1:
+                    raise Stopped("Sequencer stopped while waiting")
+
+    def wait_for(self, index: int) -> None:
+        """Call with `countdown_lock` held."""
+        bit = 1 << index
+        while not self.woken & bit:
+            self.wakeups[index].wait()
+        self.woken &= ~bit
         if not self.running:
             raise Stopped("Clock stopped while waiting")
-        if self.sequencers[index] is None:
+        if not self.registered >> index & 1:
             raise Stopped("Sequencer stopped while waiting")
 
     def register(self, seq: int) -> None:
         with self.countdown_lock:
-            index = seq - 1
-            ev = self.events[index]
-            ev.clear()
-            self.sequencers[index] = ev
+            self._register(seq - 1)
 
     def unregister(self, seq: int) -> None:
         with self.countdown_lock:
-            index = seq - 1
-            self.events[index].set()
-            self.sequencers[index] = None
-            self.bars.discard(index)
-            self.beats.discard(index)
-            for countdown_set in self.countdowns:
-                countdown_set.discard(index)
+            self._unregister(seq - 1)
+
+    def _register(self, index: int) -> None:
+        """Call with `countdown_lock` held.
+
+        Leaves `woken` alone: a sequencer flipped off and on before it ran
+        would lose its wakeup. Bar and beat waits clear their bit on entry.
+        """
+        self.registered |= 1 << index
+
+    def _unregister(self, index: int) -> None:
+        """Call with `countdown_lock` held."""
+        self.woken |= (self.bars | self.beats) & (1 << index)
+        self.registered &= ~(1 << index)
+        self.bars &= ~(1 << index)
+        self.beats &= ~(1 << index)
+        self.wakeups[index].notify_all()
 
     def is_registered(self, seq: int) -> bool:
-        return self.sequencers[seq - 1] is not None
+        return bool(self.registered >> (seq - 1) & 1)
 
     def flip(self, seq: int) -> int:
         """Returns the pad color."""
         with self.countdown_lock:
             if not self.is_registered(seq):
-                self.register(seq)
+                self._register(seq - 1)
                 return 0x30
             else:
-                self.unregister(seq)
+                self._unregister(seq - 1)
                 return 0x33
 
 
@@ -386,11 +609,23 @@ for note in all_notes:
 def midival(v: float) -> int:
     return min(127, max(0, int(v)))
 
+
+# Sequencers replay the same few notes over and over. Messages are shared,
+# so don't mutate them (mido's `send()` copies anyway).
+@functools.lru_cache(maxsize=1024)
+def note_on_message(note: int, velocity: int, channel: int) -> mido.Message:
+    return mido.Message("note_on", note=note, velocity=velocity, channel=channel)
+
+
+@functools.lru_cache(maxsize=1024)
+def note_off_message(note: int, channel: int) -> mido.Message:
+    return mido.Message("note_off", note=note, velocity=0, channel=channel)
+
 class Seq(threading.Thread):
     def __init__(self, number):
         super().__init__(name=f"Sequence {number}", daemon=True)
         self.number = number
-        self.hanging_notes: set[str] = set()
+        self.hanging_notes: dict[int, mido.Message] = {}  # (ch << 8 | note) -> off
         self.out: MIDIOut | None = None
         self.ch = 0  # channel
         self.v = 72  # velocity
@@ -430,8 +665,8 @@ class Seq(threading.Thread):
                     self.play()
             except Stopped:
                 if self.out is not None:
-                    for note_off_str in self.hanging_notes:
-                        self.out.send(mido.Message.from_str(note_off_str))
+                    self.out.send_many(self.hanging_notes.values())
+                self.hanging_notes.clear()
                 continue
 
     # Convenience APIs
@@ -448,16 +683,16 @@ class Seq(threading.Thread):
         if t == -1:
             t = self.t
         note = note + t
-        note_on = mido.Message("note_on", note=note, velocity=midival(v), channel=ch)
-        note_off = mido.Message("note_off", note=note, velocity=0, channel=ch)
-        note_off_str = str(note_off)
+        note_on = note_on_message(note, midival(v), ch)
+        note_off = note_off_message(note, ch)
+        key = ch << 8 | note
         self.out.send(note_on)
-        self.hanging_notes.add(note_off_str)
+        self.hanging_notes[key] = note_off
         gate = int(pulses * g)
         rest = pulses - gate
         self.wait(gate)
         self.out.send(note_off)
-        self.hanging_notes.discard(note_off_str)
+        self.hanging_notes.pop(key, None)
         self.wait(rest)
 
     def n1(self, note: int, v: int = -1, ch: int = -1, g: float = -1, t: int = -1) -> None:
@@ -500,6 +735,25 @@ class Seq(threading.Thread):
         if self.out is not None:
             self.out.send(mido.Message("control_change", control=c, value=midival(v)))
 
+    def cc_ramp(self, c: int, v0: int, v1: int, pulses: int) -> None:
+        """Sweeps CC `c` from `v0` to `v1` over `pulses`, sending only changes."""
+        if self.out is None:
+            return
+        if pulses <= 0:
+            self.cc(c, v1)
+            return
+        template = mido.Message("control_change", control=c)
+        first_pulse: dict[int, int] = {}  # value -> pulse it's reached at
+        for i in range(pulses + 1):
+            first_pulse.setdefault(midival(v0 + (v1 - v0) * i / pulses), i)
+        steps = [(i, template.copy(value=v)) for v, i in first_pulse.items()]
+        at = 0
+        for i, message in steps:
+            self.wait(i - at)
+            at = i
+            self.out.send(message)
+        self.wait(pulses - at)
+
     def wait(self, pulses: int) -> None:
         clock.wait(self.number, pulses)
 
@@ -612,6 +866,7 @@ Kc5j5X50PaV<]#6ds_j_uKc;"""
     import base64
     import bz2
     import pickle
+    from itertools import groupby
 
     from rich.color import Color
     from rich.console import Console, ConsoleOptions, RenderResult
@@ -628,6 +883,7 @@ Kc5j5X50PaV<]#6ds_j_uKc;"""
             background = None
             background_color = None
             padding = None
+            styles: dict[tuple[Color, Color], Style] = {}
             for line in self.color_lines:
                 if background_color is None:
                     background_color = line[0]
@@ -640,8 +896,12 @@ Kc5j5X50PaV<]#6ds_j_uKc;"""
                     background = line
                 else:
                     yield Segment(" " * padding, Style(bgcolor=background_color))
-                    for fg, bg in zip(line, background):
-                        yield Segment("▄", Style(color=fg, bgcolor=bg))
+                    for pair, run in groupby(zip(line, background)):
+                        style = styles.get(pair)
+                        if style is None:
+                            fg, bg = pair
+                            style = styles[pair] = Style(color=fg, bgcolor=bg)
+                        yield Segment("▄" * sum(1 for _ in run), style)
                     yield Segment.line()
                     background = None
 